@@ -1,6 +1,7 @@
 import glob
 import os
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from typing import Callable, Optional, Union
 
 import click
@@ -12,6 +13,7 @@
 )
 from dagster._cli.utils import get_instance_for_cli
 from dagster._cli.workspace.cli_target import (
+    ClickArgMapping,
     get_remote_repository_from_kwargs,
     repository_target_argument,
 )
@@ -21,6 +23,13 @@
 from dagster._core.scheduler.instigation import InstigatorStatus
 from dagster._core.scheduler.scheduler import DagsterDaemonScheduler
 
+# ANSI escape sequences for the per-schedule lines in `print_changes`, built once rather than
+# calling `click.style` for every line. `click.echo` still strips them when not writing to a tty.
+_GREEN = click.style("", fg="green", reset=False)
+_YELLOW = click.style("", fg="yellow", reset=False)
+_RED = click.style("", fg="red", reset=False)
+_RESET = click.style("", reset=True)
+
 
 @click.group(name="schedule")
 def schedule_cli():
@@ -83,35 +92,23 @@ def print_changes(
 
     for schedule_origin_id in added_schedules:
         print_fn(
-            click.style(
-                f"  + {schedules_dict[schedule_origin_id].name} (add) [{schedule_origin_id}]",
-                fg="green",
-            )
+            f"{_GREEN}  + {schedules_dict[schedule_origin_id].name} (add) [{schedule_origin_id}]{_RESET}"
         )
 
     for schedule_origin_id in changed_schedules:
         schedule_state = schedule_states_dict[schedule_origin_id]
         schedule = schedules_dict[schedule_origin_id]
 
+        print_fn(f"{_YELLOW}  ~ {schedule.name} (update) [{schedule_origin_id}]{_RESET}")
         print_fn(
-            click.style(
-                f"  ~ {schedule.name} (update) [{schedule_origin_id}]",
-                fg="yellow",
-            )
-        )
-        print_fn(
-            click.style("\t cron_schedule: ", fg="yellow")
-            + click.style(schedule_state.instigator_data.cron_schedule, fg="red")  # type: ignore
-            + " => "
-            + click.style(schedule.cron_schedule, fg="green")
+            f"{_YELLOW}\t cron_schedule: {_RESET}"
+            f"{_RED}{schedule_state.instigator_data.cron_schedule}{_RESET}"  # type: ignore
+            f" => {_GREEN}{schedule.cron_schedule}{_RESET}"
         )
 
     for schedule_origin_id in removed_schedules:
         print_fn(
-            click.style(
-                f"  - {schedule_states_dict[schedule_origin_id].instigator_name} (delete) [{schedule_origin_id}]",
-                fg="red",
-            )
+            f"{_RED}  - {schedule_states_dict[schedule_origin_id].instigator_name} (delete) [{schedule_origin_id}]{_RESET}"
         )
 
 
@@ -137,6 +134,16 @@ def check_repo_and_scheduler(repository: RemoteRepository, instance: DagsterInst
         )
 
 
+@contextmanager
+def _load_context(cli_args: ClickArgMapping) -> Iterator[tuple[DagsterInstance, RemoteRepository]]:
+    with get_instance_for_cli() as instance:
+        with get_remote_repository_from_kwargs(
+            instance, version=dagster_version, kwargs=cli_args
+        ) as repo:
+            check_repo_and_scheduler(repo, instance)
+            yield instance, repo
+
+
 @schedule_cli.command(
     name="preview", help="Preview changes that will be performed by `dagster schedule up`."
 )
@@ -146,13 +153,8 @@ def schedule_preview_command(**kwargs):
 
 
 def execute_preview_command(cli_args, print_fn):
-    with get_instance_for_cli() as instance:
-        with get_remote_repository_from_kwargs(
-            instance, version=dagster_version, kwargs=cli_args
-        ) as repo:
-            check_repo_and_scheduler(repo, instance)
-
-            print_changes(repo, instance, print_fn, preview=True)
+    with _load_context(cli_args) as (instance, repo):
+        print_changes(repo, instance, print_fn, preview=True)
 
 
 @schedule_cli.command(
@@ -168,54 +170,56 @@ def schedule_list_command(running, stopped, name, **kwargs):
 
 
 def execute_list_command(running_filter, stopped_filter, name_filter, cli_args, print_fn):
-    with get_instance_for_cli() as instance:
-        with get_remote_repository_from_kwargs(
-            instance, version=dagster_version, kwargs=cli_args
-        ) as repo:
-            check_repo_and_scheduler(repo, instance)
+    with _load_context(cli_args) as (instance, repo):
+        repository_name = repo.name
 
-            repository_name = repo.name
+        if not name_filter:
+            title = f"Repository {repository_name}"
+            print_fn(title)
+            print_fn("*" * len(title))
 
-            if not name_filter:
-                title = f"Repository {repository_name}"
-                print_fn(title)
-                print_fn("*" * len(title))
+        repo_schedules = repo.get_schedules()
 
-            repo_schedules = repo.get_schedules()
-            stored_schedules_by_origin_id = {
-                stored_schedule_state.instigator_origin_id: stored_schedule_state
-                for stored_schedule_state in instance.all_instigator_state(
-                    repo.get_remote_origin_id(),
-                    repo.selector_id,
-                    instigator_type=InstigatorType.SCHEDULE,
-                )
-            }
+        if name_filter and not running_filter and not stopped_filter:
+            # Listing bare names does not depend on schedule state, so skip the storage query
+            for schedule in repo_schedules:
+                print_fn(schedule.name)
+            return
+
+        stored_schedules_by_origin_id = {
+            stored_schedule_state.instigator_origin_id: stored_schedule_state
+            for stored_schedule_state in instance.all_instigator_state(
+                repo.get_remote_origin_id(),
+                repo.selector_id,
+                instigator_type=InstigatorType.SCHEDULE,
+            )
+        }
 
-            first = True
+        first = True
 
-            for schedule in repo_schedules:
-                schedule_state = schedule.get_current_instigator_state(
-                    stored_schedules_by_origin_id.get(schedule.get_remote_origin_id())
-                )
+        for schedule in repo_schedules:
+            schedule_state = schedule.get_current_instigator_state(
+                stored_schedules_by_origin_id.get(schedule.get_remote_origin_id())
+            )
 
-                if running_filter and not schedule_state.is_running:
-                    continue
-                if stopped_filter and schedule_state.is_running:
-                    continue
+            if running_filter and not schedule_state.is_running:
+                continue
+            if stopped_filter and schedule_state.is_running:
+                continue
 
-                if name_filter:
-                    print_fn(schedule.name)
-                    continue
+            if name_filter:
+                print_fn(schedule.name)
+                continue
 
-                status = "RUNNING" if schedule_state.is_running else "STOPPED"
-                schedule_title = f"Schedule: {schedule.name} [{status}]"
-                if not first:
-                    print_fn("*" * len(schedule_title))
+            status = "RUNNING" if schedule_state.is_running else "STOPPED"
+            schedule_title = f"Schedule: {schedule.name} [{status}]"
+            if not first:
+                print_fn("*" * len(schedule_title))
 
-                first = False
+            first = False
 
-                print_fn(schedule_title)
-                print_fn(f"Cron Schedule: {schedule.cron_schedule}")
+            print_fn(schedule_title)
+            print_fn(f"Cron Schedule: {schedule.cron_schedule}")
 
 
 def extract_schedule_name(schedule_name: Optional[Union[str, Sequence[str]]]) -> Optional[str]:
@@ -243,29 +247,23 @@ def schedule_start_command(schedule_name, start_all, **kwargs):
 
 
 def execute_start_command(schedule_name, all_flag, cli_args, print_fn):
-    with get_instance_for_cli() as instance:
-        with get_remote_repository_from_kwargs(
-            instance, version=dagster_version, kwargs=cli_args
-        ) as repo:
-            check_repo_and_scheduler(repo, instance)
+    with _load_context(cli_args) as (instance, repo):
+        repository_name = repo.name
 
-            repository_name = repo.name
-
-            if all_flag:
-                for remote_schedule in repo.get_schedules():
-                    try:
-                        instance.start_schedule(remote_schedule)
-                    except DagsterInvariantViolationError as ex:
-                        raise click.UsageError(ex)  # pyright: ignore[reportArgumentType]
+        if all_flag:
+            try:
+                instance.start_schedules(repo)
+            except DagsterInvariantViolationError as ex:
+                raise click.UsageError(ex)  # pyright: ignore[reportArgumentType]
 
-                print_fn(f"Started all schedules for repository {repository_name}")
-            else:
-                try:
-                    instance.start_schedule(repo.get_schedule(schedule_name))
-                except DagsterInvariantViolationError as ex:
-                    raise click.UsageError(ex)  # pyright: ignore[reportArgumentType]
+            print_fn(f"Started all schedules for repository {repository_name}")
+        else:
+            try:
+                instance.start_schedule(repo.get_schedule(schedule_name))
+            except DagsterInvariantViolationError as ex:
+                raise click.UsageError(ex)  # pyright: ignore[reportArgumentType]
 
-                print_fn(f"Started schedule {schedule_name}")
+            print_fn(f"Started schedule {schedule_name}")
 
 
 @schedule_cli.command(name="stop", help="Stop an existing schedule.")
@@ -277,23 +275,22 @@ def schedule_stop_command(schedule_name, **kwargs):
 
 
 def execute_stop_command(schedule_name, cli_args, print_fn, instance=None):
-    with get_instance_for_cli() as instance:
-        with get_remote_repository_from_kwargs(
-            instance, version=dagster_version, kwargs=cli_args
-        ) as repo:
-            check_repo_and_scheduler(repo, instance)
+    with _load_context(cli_args) as (instance, repo):
+        try:
+            remote_schedule = repo.get_schedule(schedule_name)
+            instance.stop_schedule(
+                remote_schedule.get_remote_origin_id(),
+                remote_schedule.selector_id,
+                remote_schedule,
+            )
+        except DagsterInvariantViolationError as ex:
+            raise click.UsageError(ex)  # pyright: ignore[reportArgumentType]
+
+        print_fn(f"Stopped schedule {schedule_name}")
 
-            try:
-                remote_schedule = repo.get_schedule(schedule_name)
-                instance.stop_schedule(
-                    remote_schedule.get_remote_origin_id(),
-                    remote_schedule.selector_id,
-                    remote_schedule,
-                )
-            except DagsterInvariantViolationError as ex:
-                raise click.UsageError(ex)  # pyright: ignore[reportArgumentType]
 
-            print_fn(f"Stopped schedule {schedule_name}")
+def _format_section(title: str, info: str) -> str:
+    return f"{title}\n{'=' * len(title)}\n{info}\n"
 
 
 @schedule_cli.command(name="logs", help="Get logs for a schedule.")
@@ -311,55 +308,40 @@ def schedule_logs_command(schedule_name, **kwargs):
 
 
 def execute_logs_command(schedule_name, cli_args, print_fn, instance=None):
-    with get_instance_for_cli() as instance:
-        with get_remote_repository_from_kwargs(
-            instance, version=dagster_version, kwargs=cli_args
-        ) as repo:
-            check_repo_and_scheduler(repo, instance)
-
-            if isinstance(instance.scheduler, DagsterDaemonScheduler):
-                return print_fn(
-                    "This command is deprecated for the DagsterDaemonScheduler. "
-                    "Logs for the DagsterDaemonScheduler written to the process output. "
-                    "For help troubleshooting the Daemon Scheduler, see "
-                    "https://docs.dagster.io/troubleshooting/schedules"
-                )
-
-            logs_path = os.path.join(
-                instance.logs_path_for_schedule(
-                    repo.get_schedule(schedule_name).get_remote_origin_id()
-                )
+    with _load_context(cli_args) as (instance, repo):
+        if isinstance(instance.scheduler, DagsterDaemonScheduler):
+            return print_fn(
+                "This command is deprecated for the DagsterDaemonScheduler. "
+                "Logs for the DagsterDaemonScheduler written to the process output. "
+                "For help troubleshooting the Daemon Scheduler, see "
+                "https://docs.dagster.io/troubleshooting/schedules"
             )
 
-            logs_directory = os.path.dirname(logs_path)
-            result_files = glob.glob(f"{logs_directory}/*.result")
-            most_recent_log = max(result_files, key=os.path.getctime) if result_files else None
+        logs_path = os.path.join(
+            instance.logs_path_for_schedule(repo.get_schedule(schedule_name).get_remote_origin_id())
+        )
 
-            output = ""
+        logs_directory = os.path.dirname(logs_path)
+        result_files = glob.glob(f"{logs_directory}/*.result")
+        most_recent_log = max(result_files, key=os.path.getctime) if result_files else None
 
-            title = "Scheduler Logs:"
-            output += "{title}\n{sep}\n{info}\n".format(
-                title=title,
-                sep="=" * len(title),
-                info=logs_path,
-            )
+        output = ""
 
-            title = (
-                "Schedule Execution Logs:"
-                "\nEvent logs from schedule execution. "
-                "Errors that caused schedule executions to not run or fail can be found here. "
-            )
-            most_recent_info = (
-                f"\nMost recent execution log: {most_recent_log}" if most_recent_log else ""
-            )
-            info = f"All execution logs: {logs_directory}{most_recent_info}"
-            output += "\n{title}\n{sep}\n{info}\n".format(
-                title=title,
-                sep="=" * len(title),
-                info=info,
-            )
+        title = "Scheduler Logs:"
+        output += _format_section(title, logs_path)
+
+        title = (
+            "Schedule Execution Logs:"
+            "\nEvent logs from schedule execution. "
+            "Errors that caused schedule executions to not run or fail can be found here. "
+        )
+        most_recent_info = (
+            f"\nMost recent execution log: {most_recent_log}" if most_recent_log else ""
+        )
+        info = f"All execution logs: {logs_directory}{most_recent_info}"
+        output += "\n" + _format_section(title, info)
 
-            print_fn(output)
+        print_fn(output)
 
 
 @schedule_cli.command(name="restart", help="Restart a running schedule.")
@@ -377,47 +359,20 @@ def schedule_restart_command(schedule_name, restart_all_running, **kwargs):
 
 
 def execute_restart_command(schedule_name, all_running_flag, cli_args, print_fn):
-    with get_instance_for_cli() as instance:
-        with get_remote_repository_from_kwargs(
-            instance, version=dagster_version, kwargs=cli_args
-        ) as repo:
-            check_repo_and_scheduler(repo, instance)
-
-            repository_name = repo.name
-
-            if all_running_flag:
-                for schedule_state in instance.all_instigator_state(
-                    repo.get_remote_origin_id(),
-                    repo.selector_id,
-                    InstigatorType.SCHEDULE,
-                ):
-                    if schedule_state.status == InstigatorStatus.RUNNING:
-                        try:
-                            remote_schedule = repo.get_schedule(schedule_state.instigator_name)
-                            instance.stop_schedule(
-                                schedule_state.instigator_origin_id,
-                                remote_schedule.selector_id,
-                                remote_schedule,
-                            )
-                            instance.start_schedule(remote_schedule)
-                        except DagsterInvariantViolationError as ex:
-                            raise click.UsageError(ex)  # pyright: ignore[reportArgumentType]
-
-                print_fn(f"Restarted all running schedules for repository {repository_name}")
-            else:
-                remote_schedule = repo.get_schedule(schedule_name)
-                schedule_state = instance.get_instigator_state(
-                    remote_schedule.get_remote_origin_id(),
-                    remote_schedule.selector_id,
-                )
-                if schedule_state is not None and schedule_state.status != InstigatorStatus.RUNNING:
-                    click.UsageError(
-                        f"Cannot restart a schedule {schedule_state.instigator_name} because is not currently running"
-                    )
-
+    with _load_context(cli_args) as (instance, repo):
+        repository_name = repo.name
+
+        if all_running_flag:
+            for schedule_state in instance.all_instigator_state(
+                repo.get_remote_origin_id(),
+                repo.selector_id,
+                InstigatorType.SCHEDULE,
+                instigator_statuses={InstigatorStatus.RUNNING},
+            ):
                 try:
+                    remote_schedule = repo.get_schedule(schedule_state.instigator_name)
                     instance.stop_schedule(
-                        schedule_state.instigator_origin_id,  # pyright: ignore[reportOptionalMemberAccess]
+                        schedule_state.instigator_origin_id,
                         remote_schedule.selector_id,
                         remote_schedule,
                     )
@@ -425,7 +380,29 @@ def execute_restart_command(schedule_name, all_running_flag, cli_args, print_fn)
                 except DagsterInvariantViolationError as ex:
                     raise click.UsageError(ex)  # pyright: ignore[reportArgumentType]
 
-                print_fn(f"Restarted schedule {schedule_name}")
+            print_fn(f"Restarted all running schedules for repository {repository_name}")
+        else:
+            remote_schedule = repo.get_schedule(schedule_name)
+            schedule_state = instance.get_instigator_state(
+                remote_schedule.get_remote_origin_id(),
+                remote_schedule.selector_id,
+            )
+            if schedule_state is not None and schedule_state.status != InstigatorStatus.RUNNING:
+                click.UsageError(
+                    f"Cannot restart a schedule {schedule_state.instigator_name} because is not currently running"
+                )
+
+            try:
+                instance.stop_schedule(
+                    schedule_state.instigator_origin_id,  # pyright: ignore[reportOptionalMemberAccess]
+                    remote_schedule.selector_id,
+                    remote_schedule,
+                )
+                instance.start_schedule(remote_schedule)
+            except DagsterInvariantViolationError as ex:
+                raise click.UsageError(ex)  # pyright: ignore[reportArgumentType]
+
+            print_fn(f"Restarted schedule {schedule_name}")
 
 
 @schedule_cli.command(name="wipe", help="Delete the schedule history and turn off all schedules.")
@@ -460,29 +437,15 @@ def execute_debug_command(print_fn):
         errors = debug_info.errors
         if len(errors):
             title = "Errors (Run `dagster schedule up` to resolve)"
-            output += "\n{title}\n{sep}\n{info}\n\n".format(
-                title=title,
-                sep="=" * len(title),
-                info="\n".join(debug_info.errors),
-            )
+            output += "\n" + _format_section(title, "\n".join(debug_info.errors)) + "\n"
 
         title = "Scheduler Configuration"
-        output += "{title}\n{sep}\n{info}\n".format(
-            title=title,
-            sep="=" * len(title),
-            info=debug_info.scheduler_config_info,
-        )
+        output += _format_section(title, debug_info.scheduler_config_info)
 
         title = "Scheduler Info"
-        output += "{title}\n{sep}\n{info}\n".format(
-            title=title, sep="=" * len(title), info=debug_info.scheduler_info
-        )
+        output += _format_section(title, debug_info.scheduler_info)
 
         title = "Scheduler Storage Info"
-        output += "\n{title}\n{sep}\n{info}\n".format(
-            title=title,
-            sep="=" * len(title),
-            info="\n".join(debug_info.schedule_storage),
-        )
+        output += "\n" + _format_section(title, "\n".join(debug_info.schedule_storage))
 
         print_fn(output)
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from antlr4 import CommonTokenStream, InputStream
 from antlr4.error.ErrorListener import ErrorListener
 
@@ -135,21 +137,32 @@ def visitValue(self, ctx: AssetSelectionParser.ValueContext):
             return ctx.UNQUOTED_STRING().getText()
 
 
-class AntlrAssetSelectionParser:
-    def __init__(self, selection_str: str, include_sources: bool = False):
-        lexer = AssetSelectionLexer(InputStream(selection_str))
-        lexer.removeErrorListeners()  # Remove the default listener that just writes to the console
-        lexer.addErrorListener(AntlrInputErrorListener())
+@lru_cache(maxsize=1024)
+def _parse_asset_selection(selection_str: str, include_sources: bool) -> tuple[str, AssetSelection]:
+    # The generated lexer and parser already share their deserialized ATN and DFA cache at the
+    # class level, so the remaining per-call cost is the parse itself. AssetSelection objects are
+    # immutable, so results can be shared between callers that parse the same string.
+    lexer = AssetSelectionLexer(InputStream(selection_str))
+    lexer.removeErrorListeners()  # Remove the default listener that just writes to the console
+    lexer.addErrorListener(AntlrInputErrorListener())
+
+    stream = CommonTokenStream(lexer)
 
-        stream = CommonTokenStream(lexer)
+    parser = AssetSelectionParser(stream)
+    parser.removeErrorListeners()  # Remove the default listener that just writes to the console
+    parser.addErrorListener(AntlrInputErrorListener())
 
-        parser = AssetSelectionParser(stream)
-        parser.removeErrorListeners()  # Remove the default listener that just writes to the console
-        parser.addErrorListener(AntlrInputErrorListener())
+    tree = parser.start()
+    tree_str = tree.toStringTree(recog=parser)
+    asset_selection = AntlrAssetSelectionVisitor(include_sources).visit(tree)
+    return tree_str, asset_selection
 
-        self._tree = parser.start()
-        self._tree_str = self._tree.toStringTree(recog=parser)
-        self._asset_selection = AntlrAssetSelectionVisitor(include_sources).visit(self._tree)
+
+class AntlrAssetSelectionParser:
+    def __init__(self, selection_str: str, include_sources: bool = False):
+        self._tree_str, self._asset_selection = _parse_asset_selection(
+            selection_str, include_sources
+        )
 
     @property
     def tree_str(self) -> str:
@@ -139,6 +139,7 @@
         HistoricalJob,
         RemoteJob,
         RemoteJobOrigin,
+        RemoteRepository,
         RemoteSensor,
     )
     from dagster._core.remote_representation.external import RemoteSchedule
@@ -2806,6 +2807,9 @@ def run_will_resume(self, run_id: str) -> bool:
     def start_schedule(self, remote_schedule: "RemoteSchedule") -> "InstigatorState":
         return self._scheduler.start_schedule(self, remote_schedule)  # type: ignore
 
+    def start_schedules(self, remote_repository: "RemoteRepository") -> Sequence["InstigatorState"]:
+        return self._scheduler.start_schedules(self, remote_repository)  # type: ignore
+
     def stop_schedule(
         self,
         schedule_origin_id: str,
@@ -10,7 +10,7 @@
 from dagster._core.definitions.run_request import InstigatorType
 from dagster._core.errors import DagsterError
 from dagster._core.instance import DagsterInstance
-from dagster._core.remote_representation import RemoteSchedule
+from dagster._core.remote_representation import RemoteRepository, RemoteSchedule
 from dagster._core.scheduler.instigation import (
     InstigatorState,
     InstigatorStatus,
@@ -82,6 +82,47 @@ def start_schedule(
         stored_state = instance.get_instigator_state(
             remote_schedule.get_remote_origin_id(), remote_schedule.selector_id
         )
+        return self._start_schedule_with_stored_state(instance, remote_schedule, stored_state)
+
+    def start_schedules(
+        self, instance: DagsterInstance, remote_repository: RemoteRepository
+    ) -> Sequence[InstigatorState]:
+        """Updates the status of every schedule in the given repository to
+        `InstigatorStatus.RUNNING` in schedule storage. Stored schedule states are fetched with a
+        single query for the repository rather than one query per schedule.
+
+        This should not be overridden by subclasses.
+
+        Args:
+            instance (DagsterInstance): The current instance.
+            remote_repository (RemoteRepository): The repository whose schedules should be started.
+        """
+        check.inst_param(instance, "instance", DagsterInstance)
+        check.inst_param(remote_repository, "remote_repository", RemoteRepository)
+
+        stored_states_by_selector_id = {
+            state.selector_id: state
+            for state in instance.all_instigator_state(
+                remote_repository.get_remote_origin_id(),
+                remote_repository.selector_id,
+                InstigatorType.SCHEDULE,
+            )
+        }
+        return [
+            self._start_schedule_with_stored_state(
+                instance,
+                remote_schedule,
+                stored_states_by_selector_id.get(remote_schedule.selector_id),
+            )
+            for remote_schedule in remote_repository.get_schedules()
+        ]
+
+    def _start_schedule_with_stored_state(
+        self,
+        instance: DagsterInstance,
+        remote_schedule: RemoteSchedule,
+        stored_state: Optional[InstigatorState],
+    ) -> InstigatorState:
         computed_state = remote_schedule.get_current_instigator_state(stored_state)
         if computed_state.is_running:
             return computed_state
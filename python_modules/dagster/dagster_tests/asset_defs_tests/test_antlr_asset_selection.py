@@ -6,7 +6,6 @@
     AssetSelectionParser,
 )
 from dagster._core.definitions.asset_selection import AssetSelection, CodeLocationAssetSelection
-from dagster._core.definitions.decorators.asset_decorator import asset
 from dagster._core.storage.tags import KIND_PREFIX
 
 
@@ -104,8 +103,10 @@ def test_antlr_tree(selection_str, expected_tree_str) -> None:
     ],
 )
 def test_antlr_tree_invalid(selection_str):
-    with pytest.raises(Exception):
-        AntlrAssetSelectionParser(selection_str)
+    # parse results are cached, so make sure repeated invalid inputs keep raising
+    for _ in range(2):
+        with pytest.raises(Exception):
+            AntlrAssetSelectionParser(selection_str)
 
 
 @pytest.mark.parametrize(
@@ -156,19 +157,6 @@ def test_antlr_tree_invalid(selection_str):
     ],
 )
 def test_antlr_visit_basic(selection_str, expected_assets) -> None:
-    # a -> b -> c
-    @asset(tags={"foo": "bar"}, owners=["team:billing"])
-    def a(): ...
-
-    @asset(deps=[a], kinds={"python", "snowflake"})
-    def b(): ...
-
-    @asset(
-        deps=[b],
-        group_name="my_group",
-    )
-    def c(): ...
-
     generated_selection = AntlrAssetSelectionParser(
         selection_str, include_sources=True
     ).asset_selection
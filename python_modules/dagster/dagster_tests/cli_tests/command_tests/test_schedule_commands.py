@@ -46,6 +46,29 @@ def test_schedules_list(gen_schedule_args):
             )
 
 
+@pytest.mark.parametrize("gen_schedule_args", schedule_command_contexts())
+def test_schedules_list_names(gen_schedule_args):
+    with gen_schedule_args as (cli_args, instance):
+        runner = CliRunner()
+        with mock.patch("dagster._core.instance.DagsterInstance.get") as _instance:
+            _instance.return_value = instance
+
+            result = runner.invoke(schedule_list_command, cli_args + ["--name"])
+            assert result.exit_code == 0
+            assert result.output == "foo_schedule\nunion_schedule\n"
+
+            result = runner.invoke(schedule_start_command, cli_args + ["foo_schedule"])
+            assert result.exit_code == 0
+
+            result = runner.invoke(schedule_list_command, cli_args + ["--name", "--running"])
+            assert result.exit_code == 0
+            assert result.output == "foo_schedule\n"
+
+            result = runner.invoke(schedule_list_command, cli_args + ["--name", "--stopped"])
+            assert result.exit_code == 0
+            assert result.output == "union_schedule\n"
+
+
 @pytest.mark.parametrize("gen_schedule_args", schedule_command_contexts())
 def test_schedules_start_and_stop(gen_schedule_args):
     with gen_schedule_args as (cli_args, instance):
@@ -100,6 +123,10 @@ def test_schedules_start_all(gen_schedule_args):
             assert result.exit_code == 0
             assert result.output == "Started all schedules for repository bar\n"
 
+            result = runner.invoke(schedule_list_command, cli_args + ["--name", "--running"])
+            assert result.exit_code == 0
+            assert result.output == "foo_schedule\nunion_schedule\n"
+
 
 def test_schedules_wipe_correct_delete_message():
     runner = CliRunner()
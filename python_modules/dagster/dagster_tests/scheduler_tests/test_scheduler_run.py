@@ -900,6 +900,64 @@ def _get_state(external_schedule):
             assert len(_get_ticks(running_schedule)) == 1
 
 
+def test_start_schedules(instance: DagsterInstance, remote_repo: RemoteRepository):
+    running_schedule = remote_repo.get_schedule("simple_schedule")
+    stopped_schedule = remote_repo.get_schedule("simple_schedule_no_timezone")
+
+    # Store the running schedule under an origin that differs only in its executable path, as if
+    # it had been started from a differently-loaded workspace. States are matched by selector.
+    existing_origin = running_schedule.get_remote_origin()
+    code_location_origin = existing_origin.repository_origin.code_location_origin
+    assert isinstance(code_location_origin, ManagedGrpcPythonEnvCodeLocationOrigin)
+    modified_origin = existing_origin._replace(
+        repository_origin=existing_origin.repository_origin._replace(
+            code_location_origin=code_location_origin._replace(
+                loadable_target_origin=code_location_origin.loadable_target_origin._replace(
+                    executable_path="/different/executable_path"
+                )
+            )
+        )
+    )
+    running_state = instance.add_instigator_state(
+        InstigatorState(
+            modified_origin,
+            InstigatorType.SCHEDULE,
+            InstigatorStatus.RUNNING,
+            ScheduleInstigatorData(running_schedule.cron_schedule, get_current_timestamp()),
+        )
+    )
+
+    instance.start_schedule(stopped_schedule)
+    instance.stop_schedule(
+        stopped_schedule.get_remote_origin_id(), stopped_schedule.selector_id, stopped_schedule
+    )
+
+    started_states = {
+        state.instigator_name: state for state in instance.start_schedules(remote_repo)
+    }
+    assert started_states["simple_schedule"] == running_state
+    assert started_states["simple_schedule_no_timezone"].status == InstigatorStatus.RUNNING
+
+    all_states = instance.all_instigator_state(
+        remote_repo.get_remote_origin_id(), remote_repo.selector_id, InstigatorType.SCHEDULE
+    )
+    assert len(all_states) == len(remote_repo.get_schedules())
+    assert all(state.status == InstigatorStatus.RUNNING for state in all_states)
+
+    # already-running and previously-stopped schedules are updated in place, not re-added
+    assert (
+        instance.get_instigator_state(
+            running_schedule.get_remote_origin_id(), running_schedule.selector_id
+        )
+        == running_state
+    )
+    stopped_schedule_state = instance.get_instigator_state(
+        stopped_schedule.get_remote_origin_id(), stopped_schedule.selector_id
+    )
+    assert stopped_schedule_state
+    assert stopped_schedule_state.status == InstigatorStatus.RUNNING
+
+
 # Schedules with status defined in code have that status applied
 @pytest.mark.parametrize("executor", get_schedule_executors())
 def test_status_in_code_schedule(instance: DagsterInstance, executor: ThreadPoolExecutor):
@@ -1,7 +1,6 @@
 import json
 import sys
 from pathlib import Path
-from typing import Any
 
 import click
 
@@ -38,12 +37,17 @@ def list_component_types_command(ctx: click.Context) -> None:
             builtin_component_lib=builtin_component_lib
         ),
     )
-    output: dict[str, Any] = {}
-    for key, component_type in context.list_component_types():
+    # Emit the JSON object one entry at a time rather than materializing the full document, so
+    # only a single component type's metadata is held in memory at once. The output is
+    # byte-identical to `json.dumps` over the full mapping.
+    click.echo("{", nl=False)
+    for i, (key, component_type) in enumerate(context.list_component_types()):
         package, name = key.rsplit(".", 1)
-        output[key] = ComponentTypeMetadata(
+        metadata = ComponentTypeMetadata(
             name=name,
             package=package,
             **component_type.get_metadata(),
         )
-    click.echo(json.dumps(output))
+        separator = ", " if i > 0 else ""
+        click.echo(f"{separator}{json.dumps(key)}: {json.dumps(metadata)}", nl=False)
+    click.echo("}")
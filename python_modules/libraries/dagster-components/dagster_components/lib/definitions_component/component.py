@@ -1,4 +1,7 @@
+import hashlib
+from functools import lru_cache
 from pathlib import Path
+from types import ModuleType
 from typing import Optional
 
 from dagster._core.definitions.definitions_class import Definitions
@@ -14,6 +17,17 @@
 from dagster_components.lib.definitions_component.generator import DefinitionsComponentGenerator
 
 
+@lru_cache(maxsize=128)
+def _load_definitions_module(
+    working_dir: str, definitions_path: str, content_hash: str
+) -> ModuleType:
+    # content_hash is only part of the cache key, so that edits to the file invalidate the entry.
+    # Only the definitions file itself is tracked: edits to modules it imports do not invalidate
+    # the cached module.
+    with pushd(working_dir):
+        return import_uncached_module_from_path("definitions", definitions_path)
+
+
 class DefinitionsParamSchema(BaseModel):
     definitions_path: Optional[str] = None
 
@@ -37,7 +51,11 @@ def load(cls, context: ComponentLoadContext) -> Self:
         return cls(definitions_path=Path(loaded_params.definitions_path or "definitions.py"))
 
     def build_defs(self, context: ComponentLoadContext) -> Definitions:
-        with pushd(str(context.path)):
-            module = import_uncached_module_from_path("definitions", str(self.definitions_path))
+        definitions_path = (context.path / self.definitions_path).resolve()
+        module = _load_definitions_module(
+            str(context.path),
+            str(definitions_path),
+            hashlib.sha256(definitions_path.read_bytes()).hexdigest(),
+        )
 
         return load_definitions_from_module(module)
@@ -37,6 +37,8 @@ def test_list_component_types_command():
         cli, ["--builtin-component-lib", "dagster_components.test", "list", "component-types"]
     )
     assert result.exit_code == 0
+    # output is streamed entry by entry but should match a single json.dumps of the mapping
+    assert result.output == json.dumps(json.loads(result.output)) + "\n"
     result = json.loads(result.output)
 
     assert list(result.keys()) == [
@@ -1,4 +1,14 @@
+import hashlib
+import textwrap
+from pathlib import Path
+
 from dagster._core.definitions.asset_key import AssetKey
+from dagster_components.core.component import ComponentLoadContext
+from dagster_components.core.component_decl_builder import ComponentFileModel, YamlComponentDecl
+from dagster_components.lib.definitions_component.component import (
+    DefinitionsComponent,
+    _load_definitions_module,
+)
 
 from dagster_components_tests.integration_tests.component_loader import load_test_component_defs
 
@@ -11,3 +21,52 @@ def test_definitions_component_with_default_file() -> None:
 def test_definitions_component_with_explicit_file() -> None:
     defs = load_test_component_defs("definitions/explicit_file")
     assert {spec.key for spec in defs.get_all_asset_specs()} == {AssetKey("asset_in_some_file")}
+
+
+def test_definitions_module_cached_until_modified(tmp_path: Path) -> None:
+    definitions_path = tmp_path / "definitions.py"
+
+    def _load():
+        return _load_definitions_module(
+            str(tmp_path),
+            str(definitions_path),
+            hashlib.sha256(definitions_path.read_bytes()).hexdigest(),
+        )
+
+    definitions_path.write_text("VALUE = 1\n")
+    module = _load()
+    assert module.VALUE == 1
+    assert _load() is module
+
+    # rewritten immediately, so the mtime may not have changed
+    definitions_path.write_text("VALUE = 2\n")
+    assert _load().VALUE == 2
+
+
+def test_definitions_component_build_defs_executes_file_once(tmp_path: Path) -> None:
+    executions_path = tmp_path / "executions.txt"
+    (tmp_path / "definitions.py").write_text(
+        textwrap.dedent(f"""
+            from dagster import asset
+
+            with open({str(executions_path)!r}, "a") as f:
+                f.write("executed\\n")
+
+
+            @asset
+            def cached_asset() -> None: ...
+        """)
+    )
+    context = ComponentLoadContext.for_test(
+        decl_node=YamlComponentDecl(
+            path=tmp_path,
+            component_file_model=ComponentFileModel(type="dagster_components.definitions"),
+        )
+    )
+    component = DefinitionsComponent(definitions_path=Path("definitions.py"))
+
+    for _ in range(2):
+        defs = component.build_defs(context)
+        assert {spec.key for spec in defs.get_all_asset_specs()} == {AssetKey("cached_asset")}
+
+    assert executions_path.read_text().splitlines() == ["executed"]